@@ -0,0 +1,99 @@
+import glob
+import os
+import time
+from difflib import SequenceMatcher
+
+import cv2
+
+from paddle_ocr4 import OCRProcessor
+
+SAMPLE_GLOB = "sample/*.png"
+SAVE_FOLDER = "./output/benchmark"
+FONT_PATH = "./fonts/german.ttf"
+
+ONNX = {"det": "onnx", "rec": "onnx", "table": "onnx", "layout": "onnx"}
+ONNX_INT8 = {"det": "onnx_int8", "rec": "onnx_int8", "table": "onnx_int8", "layout": "onnx_int8"}
+
+# name: (backends, enable_mkldnn, threads). Paddle only applies cpu_threads with MKL-DNN enabled, so stock
+# Paddle runs on one thread and is compared with ONNX on one thread; None stands for the cpu_threads argument.
+BACKEND_CONFIGS = {
+    "paddle": ({}, False, 1),
+    "onnx_1t": (ONNX, False, 1),
+    "onnx_int8_1t": (ONNX_INT8, False, 1),
+    "paddle_mkldnn": ({}, True, None),
+    "onnx": (ONNX, False, None),
+    "onnx_int8": (ONNX_INT8, False, None),
+}
+
+
+def run_backend(backends, enable_mkldnn, images, cpu_threads):
+    """
+    Runs text and table detection for every image with one backend configuration.
+    Only the engine calls are timed; reading images, printing and saving results are left out.
+
+    :param images: A dict mapping image path to the loaded image.
+    :return: A dict mapping image path to (text, table html, text seconds, table seconds).
+    """
+    processor = OCRProcessor(
+        save_folder=SAVE_FOLDER,
+        img_path=None,
+        font_path=FONT_PATH,
+        backends=backends,
+        cpu_threads=cpu_threads,
+        enable_mkldnn=enable_mkldnn,
+    )
+    ocr_engine = processor.get_ocr_engine()
+    table_engine = processor.get_table_engine()
+
+    # Warm the models up outside of the timed region
+    warmup_image = next(iter(images.values()))
+    ocr_engine.ocr(warmup_image, cls=True)
+    table_engine(warmup_image)
+
+    results = {}
+    for image_path, img in images.items():
+        start = time.perf_counter()
+        text_result = ocr_engine.ocr(img, cls=True)
+        text_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table_result = table_engine(img)
+        table_seconds = time.perf_counter() - start
+
+        text = "\n".join(line[1][0] for line in text_result[0] or [])
+        html = "\n".join(region["res"]["html"] for region in table_result if region["type"] == "table")
+        results[image_path] = (text, html, text_seconds, table_seconds)
+
+    return results
+
+
+def main(cpu_threads=4):
+    images = {}
+    for image_path in sorted(glob.glob(SAMPLE_GLOB)):
+        img = cv2.imread(image_path)
+        if img is None:
+            raise ValueError(f"Image at path {image_path} could not be loaded.")
+        images[image_path] = img
+
+    all_results = {}
+    for name, (backends, enable_mkldnn, threads) in BACKEND_CONFIGS.items():
+        all_results[name] = run_backend(backends, enable_mkldnn, images, threads or cpu_threads)
+
+    # Accuracy is measured as text and table HTML similarity against the stock Paddle output
+    baseline = all_results["paddle"]
+    print(f"{'backend':<15}{'threads':>8}  {'image':<25}{'text ms':>10}{'table ms':>10}{'text sim':>10}{'table sim':>11}")
+    for name, results in all_results.items():
+        threads = BACKEND_CONFIGS[name][2] or cpu_threads
+        for image_path, (text, html, text_seconds, table_seconds) in results.items():
+            baseline_text, baseline_html = baseline[image_path][:2]
+            text_similarity = SequenceMatcher(None, baseline_text, text).ratio()
+            table_similarity = SequenceMatcher(None, baseline_html, html).ratio()
+            print(
+                f"{name:<15}{threads:>8}  {os.path.basename(image_path):<25}"
+                f"{text_seconds * 1000:>10.1f}{table_seconds * 1000:>10.1f}"
+                f"{text_similarity:>10.3f}{table_similarity:>11.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,29 @@ from basicsr.archs.rrdbnet_arch import RRDBNet
 from realesrgan import RealESRGANer
 
 
+def load_upsampler(model_path, device):
+    model = RRDBNet(
+        num_in_ch=3,
+        num_out_ch=3,
+        num_feat=64,
+        num_block=23,
+        num_grow_ch=32,
+        scale=4,
+    )
+    upsampler = RealESRGANer(
+        scale=4,
+        model_path=model_path,
+        model=model,
+        tile=0,
+        tile_pad=10,
+        pre_pad=0,
+        # Half precision is only supported on the GPU
+        half=device != "cpu",
+        device=device,
+    )
+    return upsampler
+
+
 class ImageEnhancer:
     def __init__(
         self,
@@ -13,11 +36,13 @@ class ImageEnhancer:
         output_directory_or_path=None,
         model_path=None,
         device="cuda" if torch.cuda.is_available() else "cpu",
+        model=None,
     ):
         self.input_image_path = input_image_path
         self.device = device
         self.model_path = model_path or "RealESRGAN_x4plus.pth"
-        self.model = self.load_model()
+        # An already loaded upsampler can be shared, e.g. by workers forked after loading it
+        self.model = model or self.load_model()
 
         # Determine the output directory and optional file name
         if output_directory_or_path:
@@ -43,25 +68,7 @@ class ImageEnhancer:
             )
 
     def load_model(self):
-        model = RRDBNet(
-            num_in_ch=3,
-            num_out_ch=3,
-            num_feat=64,
-            num_block=23,
-            num_grow_ch=32,
-            scale=4,
-        )
-        upsampler = RealESRGANer(
-            scale=4,
-            model_path=self.model_path,
-            model=model,
-            tile=0,
-            tile_pad=10,
-            pre_pad=0,
-            half=True,
-            device=self.device,
-        )
-        return upsampler
+        return load_upsampler(self.model_path, self.device)
 
     def enhance(self, outscale=4):
         """
@@ -1,5 +1,8 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
+import numpy as np
 
 class ImageProcessor:
     """
@@ -231,6 +234,240 @@ class ImageProcessor:
         
         return output_image_path
 
+class BatchImageProcessor:
+    """
+    Processes many images at once. Images of the same shape are held as a single contiguous
+    (N, height, width[, channels]) array, so element-wise operations run as one call over the
+    whole batch, and per-image OpenCV calls run in a thread pool (OpenCV releases the GIL).
+    """
+    def __init__(self, input_image_paths, output_directory=None, workers=None):
+        self.input_image_paths = list(input_image_paths)
+        self.output_directory = output_directory or './output'
+        self.workers = workers or os.cpu_count()
+
+        # Ensure the output directory exists
+        if not os.path.exists(self.output_directory):
+            os.makedirs(self.output_directory)
+
+        images = self._map(cv2.imread, self.input_image_paths)
+        for input_image_path, img in zip(self.input_image_paths, images):
+            if img is None:
+                raise ValueError(f"Image at path {input_image_path} could not be loaded.")
+
+        # Stack images of the same shape into a batch sized by the number of images in the group,
+        # dropping every group's images once they are copied
+        indices_by_shape = {}
+        for index, img in enumerate(images):
+            indices_by_shape.setdefault(img.shape, []).append(index)
+
+        self.batches = []
+        for indices in indices_by_shape.values():
+            self.batches.append((indices, np.stack([images[index] for index in indices])))
+            for index in indices:
+                images[index] = None
+
+    def _map(self, function, items):
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(function, items))
+
+    def _flat(self, batch):
+        # A 2D view of the batch, so that element-wise OpenCV calls process it in one call
+        return batch.reshape(batch.shape[0] * batch.shape[1], -1)
+
+    def _apply(self, output_shape, function):
+        """
+        Runs function(img, dst) for every image in the thread pool, writing into one preallocated
+        batch per output shape instead of stacking per-image results.
+
+        :param output_shape: Maps the shape of an image to the shape of its result.
+        :param function: Writes the result for img into dst.
+        """
+        groups_by_shape = {}
+        for indices, batch in self.batches:
+            groups_by_shape.setdefault(output_shape(batch.shape[1:]), []).append((indices, batch))
+
+        batches = []
+        for shape, groups in groups_by_shape.items():
+            output = np.empty((sum(len(indices) for indices, _ in groups),) + shape, dtype=groups[0][1].dtype)
+            output_indices, jobs = [], []
+            for indices, batch in groups:
+                jobs.extend(zip(batch, output[len(output_indices):len(output_indices) + len(indices)]))
+                output_indices.extend(indices)
+
+            self._map(lambda job: function(*job), jobs)
+            batches.append((output_indices, output))
+
+        self.batches = batches
+
+    def _views(self):
+        # The images in the input order, as views into the batches
+        images = [None] * len(self.input_image_paths)
+        for indices, batch in self.batches:
+            for index, img in zip(indices, batch):
+                images[index] = img
+        return images
+
+    def images(self):
+        """
+        Returns copies of the current images in the input order.
+
+        :return: A list of images.
+        """
+        return [img.copy() for img in self._views()]
+
+    def add_padding(self, padding=0, color=(0, 0, 0)):
+        """
+        Adds custom padding to every image.
+
+        :param padding: A single integer for uniform padding or a tuple/list of four integers (top, bottom, left, right).
+        :param color: The color for the padding (BGR).
+        :return: Self, to allow chaining.
+        """
+        if isinstance(padding, (int, float)):
+            top = bottom = left = right = padding
+        elif isinstance(padding, (tuple, list)) and len(padding) == 4:
+            top, bottom, left, right = padding
+        else:
+            raise ValueError("Padding must be an integer or a list/tuple of four integers.")
+
+        top, bottom, left, right = int(top), int(bottom), int(left), int(right)
+        self._apply(
+            lambda shape: (shape[0] + top + bottom, shape[1] + left + right) + shape[2:],
+            lambda img, dst: cv2.copyMakeBorder(
+                img, top, bottom, left, right, cv2.BORDER_CONSTANT, dst=dst, value=color
+            ),
+        )
+        return self
+
+    def make_square(self, color=(0, 0, 0)):
+        """
+        Automatically adds padding to make every image square.
+
+        :param color: The color for the padding (BGR).
+        :return: Self, to allow chaining.
+        """
+        def pad_to_square(img, dst):
+            original_height, original_width = img.shape[:2]
+            new_size = max(original_width, original_height)
+
+            top = (new_size - original_height) // 2
+            bottom = new_size - original_height - top
+            left = (new_size - original_width) // 2
+            right = new_size - original_width - left
+
+            cv2.copyMakeBorder(img, top, bottom, left, right, cv2.BORDER_CONSTANT, dst=dst, value=color)
+
+        self._apply(lambda shape: (max(shape[:2]), max(shape[:2])) + shape[2:], pad_to_square)
+        return self
+
+    def resize(self, scale_factor=1):
+        """
+        Resizes every image by a given scale factor.
+
+        :param scale_factor: The factor by which to resize the images. Greater than 1 for upscaling, less than 1 for downscaling.
+        :return: Self, to allow chaining.
+        """
+        if scale_factor <= 0:
+            raise ValueError("Scale factor must be greater than 0.")
+
+        self._apply(
+            lambda shape: (int(shape[0] * scale_factor), int(shape[1] * scale_factor)) + shape[2:],
+            lambda img, dst: cv2.resize(img, (dst.shape[1], dst.shape[0]), dst=dst, interpolation=cv2.INTER_LINEAR),
+        )
+        return self
+
+    def resize_to_dimensions(self, width, height):
+        """
+        Resizes every image to the specified width and height.
+
+        :param width: The desired width of the images.
+        :param height: The desired height of the images.
+        :return: Self, to allow chaining.
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError("Width and height must be greater than 0.")
+
+        self._apply(
+            lambda shape: (height, width) + shape[2:],
+            lambda img, dst: cv2.resize(img, (width, height), dst=dst, interpolation=cv2.INTER_LINEAR),
+        )
+        return self
+
+    def adjust_brightness_contrast(self, brightness=0, contrast=0):
+        """
+        Adjusts the brightness and contrast of every image.
+
+        :param brightness: Value to adjust brightness (-255 to 255).
+        :param contrast: Value to adjust contrast (-127 to 127).
+        :return: Self, to allow chaining.
+        """
+        for _, batch in self.batches:
+            flat = self._flat(batch)
+            cv2.convertScaleAbs(flat, dst=flat, alpha=1 + contrast / 127.0, beta=brightness)
+        return self
+
+    def invert_colors(self):
+        """
+        Inverts the colors of every image.
+
+        :return: Self, to allow chaining.
+        """
+        for _, batch in self.batches:
+            flat = self._flat(batch)
+            cv2.bitwise_not(flat, dst=flat)
+        return self
+
+    def to_grayscale(self):
+        """
+        Converts every image to grayscale.
+
+        :return: Self, to allow chaining.
+        """
+        batches = []
+        for indices, batch in self.batches:
+            # All images of a batch are BGR, so converting the (N * height, width) view converts them all
+            gray = np.empty(batch.shape[:3], dtype=batch.dtype)
+            cv2.cvtColor(batch.reshape(-1, batch.shape[2], batch.shape[3]), cv2.COLOR_BGR2GRAY, dst=gray.reshape(-1, batch.shape[2]))
+            batches.append((indices, gray))
+
+        self.batches = batches
+        return self
+
+    def get_dimensions(self):
+        """
+        Returns the current dimensions of every image.
+
+        :return: A list of tuples (width, height), in the input order.
+        """
+        return [(img.shape[1], img.shape[0]) for img in self._views()]
+
+    def save(self, output_image_names=None, format=None):
+        """
+        Saves every processed image in the output directory with the specified output image names or falls back to the input image names.
+
+        :param output_image_names: Optional. Names to save the images as, in the input order.
+        :param format: Optional. Format to save the images (e.g., 'png', 'jpg').
+        :return: The paths where the images were saved, in the input order.
+        """
+        file_names = output_image_names or [os.path.basename(path) for path in self.input_image_paths]
+        if len(file_names) != len(self.input_image_paths):
+            raise ValueError("Exactly one output image name must be given per input image.")
+
+        output_image_paths = []
+        for file_name in file_names:
+            if format:
+                file_name = f"{os.path.splitext(file_name)[0]}.{format}"
+            output_image_paths.append(os.path.join(self.output_directory, file_name))
+
+        if len(set(output_image_paths)) != len(output_image_paths):
+            raise ValueError("Output image names must be unique. Pass output_image_names to save inputs sharing a name.")
+
+        self._map(lambda args: cv2.imwrite(*args), zip(output_image_paths, self._views()))
+        print(f"{len(output_image_paths)} images saved to {self.output_directory}")
+
+        return output_image_paths
+
+
 if __name__ == "__main__":
     # Example usage:
     input_image_path = "sample/sample.png"
@@ -286,3 +523,9 @@ if __name__ == "__main__":
     # Get image dimensions
     dimensions = resizer.get_dimensions()
     print(f"Image dimensions: {dimensions}")
+
+    # Batch processing: every sample image is padded, squared, resized and converted at once
+    batch_processor = BatchImageProcessor(["sample/sample.png", "sample/sample1.png"], output_directory="output_images/batch/")
+    output_paths = batch_processor.add_padding(10).make_square().resize_to_dimensions(460, 460).to_grayscale().save()
+    print(f"Final images saved at: {output_paths}")
+    print(f"Image dimensions: {batch_processor.get_dimensions()}")
@@ -0,0 +1,131 @@
+import os
+import subprocess
+
+BACKENDS = ("paddle", "onnx", "onnx_int8")
+
+ONNX_MODEL_NAME = "model.onnx"
+ONNX_INT8_MODEL_NAME = "model_int8.onnx"
+
+
+def onnx_model_path(model_dir, backend="onnx"):
+    """
+    Returns the path of the converted ONNX model stored inside a Paddle inference model directory.
+
+    :param model_dir: The Paddle inference model directory (containing inference.pdmodel).
+    :param backend: Either 'onnx' for the fp32 model or 'onnx_int8' for the quantized one.
+    :return: The path to the ONNX model file.
+    """
+    if backend == "onnx":
+        return os.path.join(model_dir, ONNX_MODEL_NAME)
+    if backend == "onnx_int8":
+        return os.path.join(model_dir, ONNX_INT8_MODEL_NAME)
+    raise ValueError(f"Backend must be one of {BACKENDS[1:]}, got {backend!r}.")
+
+
+def create_session(model_path, cpu_threads=None):
+    """
+    Creates an onnxruntime session for CPU inference.
+
+    The oneDNN (MKL-DNN) execution provider is only used by onnxruntime builds that ship it. The
+    pinned onnxruntime CPU wheel does not, so it runs on the default CPU provider.
+
+    :param model_path: Path to the ONNX model file.
+    :param cpu_threads: Optional. Number of intra-op threads. Defaults to onnxruntime's choice.
+    :return: The onnxruntime InferenceSession.
+    """
+    if not os.path.exists(model_path):
+        raise ValueError(
+            f"ONNX model at path {model_path} not found. Run onnx_backend.py to convert the models first."
+        )
+
+    # Imported here so that Paddle-only setups do not need the ONNX stack
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    if cpu_threads:
+        options.intra_op_num_threads = cpu_threads
+        options.inter_op_num_threads = 1
+
+    available = ort.get_available_providers()
+    providers = [
+        provider
+        for provider in ("DnnlExecutionProvider", "CPUExecutionProvider")
+        if provider in available
+    ]
+
+    return ort.InferenceSession(model_path, sess_options=options, providers=providers)
+
+
+def attach_session(predictor, model_path, cpu_threads=None):
+    """
+    Swaps the Paddle predictor of a PaddleOCR model wrapper (TextDetector, TextRecognizer,
+    TableStructurer or LayoutPredictor) for an onnxruntime session, so each model can use its own backend.
+
+    :param predictor: The PaddleOCR model wrapper holding the predictor.
+    :param model_path: Path to the ONNX model file.
+    :param cpu_threads: Optional. Number of intra-op threads.
+    :return: The predictor, now running on onnxruntime.
+    """
+    session = create_session(model_path, cpu_threads=cpu_threads)
+    predictor.predictor = session
+    predictor.input_tensor = session.get_inputs()[0]
+    predictor.output_tensors = None
+    predictor.config = None
+    predictor.use_onnx = True
+    return predictor
+
+
+def convert_model(model_dir, opset_version=11):
+    """
+    Converts a Paddle inference model directory to ONNX with paddle2onnx.
+
+    :param model_dir: The Paddle inference model directory (containing inference.pdmodel).
+    :param opset_version: The ONNX opset to export.
+    :return: The path to the converted ONNX model.
+    """
+    output_path = onnx_model_path(model_dir, "onnx")
+    subprocess.run(
+        [
+            "paddle2onnx",
+            "--model_dir", model_dir,
+            "--model_filename", "inference.pdmodel",
+            "--params_filename", "inference.pdiparams",
+            "--save_file", output_path,
+            "--opset_version", str(opset_version),
+            "--enable_onnx_checker", "True",
+        ],
+        check=True,
+    )
+    print(f"ONNX model saved to {output_path}")
+    return output_path
+
+
+def quantize_model(model_dir):
+    """
+    Quantizes the converted ONNX model of a model directory to INT8 weights (dynamic quantization).
+
+    :param model_dir: The Paddle inference model directory holding the converted ONNX model.
+    :return: The path to the quantized ONNX model.
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    input_path = onnx_model_path(model_dir, "onnx")
+    output_path = onnx_model_path(model_dir, "onnx_int8")
+    quantize_dynamic(input_path, output_path, weight_type=QuantType.QUInt8)
+    print(f"Quantized ONNX model saved to {output_path}")
+    return output_path
+
+
+if __name__ == "__main__":
+    model_dirs = [
+        "models/default/PP-OCRv4/det_en/en_PP-OCRv3_det_infer",
+        "models/default/PP-OCRv4/rec_en/en_PP-OCRv4_rec_infer",
+        "models/default/PP-StructureV2/table_en/en_ppstructure_mobile_v2.0_SLANet_infer",
+        "models/custom/PP-StructureV2/layout_en/picodet_lcnet_x1_0_fgd_layout_infer",
+    ]
+
+    for model_dir in model_dirs:
+        convert_model(model_dir)
+        quantize_model(model_dir)
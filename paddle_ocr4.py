@@ -5,12 +5,31 @@ from paddleocr import PaddleOCR, PPStructure, draw_ocr, draw_structure_result, s
 from PIL import Image
 from image_processor import ImageProcessor
 from image_enhancer import ImageEnhancer
+from onnx_backend import BACKENDS, attach_session, onnx_model_path
 
 class OCRProcessor:
-    def __init__(self, save_folder, img_path, font_path):
+    def __init__(self, save_folder, img_path, font_path, backends=None, cpu_threads=10, enable_mkldnn=False):
+        """
+        :param backends: Optional. Dict selecting the inference backend per model ('det', 'rec', 'table', 'layout'),
+                         each one of 'paddle', 'onnx' or 'onnx_int8'. Models not listed run on Paddle.
+                         The det and rec backends apply to both detect_text() and detect_table().
+        :param cpu_threads: Number of CPU threads used by each ONNX model, and by each Paddle model when
+                            enable_mkldnn is set (without MKL-DNN, Paddle runs on a single math thread).
+        :param enable_mkldnn: Whether the Paddle predictors use MKL-DNN.
+        """
         self.save_folder = save_folder
         self.img_path = img_path
         self.font_path = font_path
+        self.cpu_threads = cpu_threads
+        self.enable_mkldnn = enable_mkldnn
+
+        self.backends = {"det": "paddle", "rec": "paddle", "table": "paddle", "layout": "paddle"}
+        for model, backend in (backends or {}).items():
+            if model not in self.backends:
+                raise ValueError(f"Backend can only be selected for {tuple(self.backends)}, got {model!r}.")
+            if backend not in BACKENDS:
+                raise ValueError(f"Backend must be one of {BACKENDS}, got {backend!r}.")
+            self.backends[model] = backend
 
         self.det_model_dir = "models/default/PP-OCRv4/det_en/en_PP-OCRv3_det_infer"
         self.rec_model_dir = "models/default/PP-OCRv4/rec_en/en_PP-OCRv4_rec_infer"
@@ -20,6 +39,8 @@ class OCRProcessor:
 
         self.result_table = None
         self.result_text = None
+        self.table_engine = None
+        self.ocr_engine = None
 
         self.ensure_directory_exists(self.save_folder)
 
@@ -27,15 +48,65 @@ class OCRProcessor:
         if not os.path.exists(directory):
             os.makedirs(directory)
 
+    def use_backend(self, predictor, model, model_dir):
+        if self.backends[model] != "paddle":
+            attach_session(predictor, onnx_model_path(model_dir, self.backends[model]), self.cpu_threads)
+
+    def get_table_engine(self):
+        if self.table_engine is None:
+            self.table_engine = PPStructure(
+                show_log=True,
+                image_orientation=True,
+                lang="en",
+                det_model_dir=self.det_model_dir,
+                rec_model_dir=self.rec_model_dir,
+                table_model_dir=self.table_model_dir,
+                layout_model_dir=self.layout_model_dir,
+                layout_dict_path=self.layout_dict_path,
+                cpu_threads=self.cpu_threads,
+                enable_mkldnn=self.enable_mkldnn,
+            )
+            # The table system reuses the text detector and recognizer of the engine's text system
+            self.use_backend(self.table_engine.text_system.text_detector, "det", self.det_model_dir)
+            self.use_backend(self.table_engine.text_system.text_recognizer, "rec", self.rec_model_dir)
+            self.use_backend(self.table_engine.table_system.table_structurer, "table", self.table_model_dir)
+            self.use_backend(self.table_engine.layout_predictor, "layout", self.layout_model_dir)
+
+        return self.table_engine
+
+    def get_ocr_engine(self):
+        if self.ocr_engine is None:
+            self.ocr_engine = PaddleOCR(
+                use_angle_cls=True,
+                lang="en",
+                det_model_dir=self.det_model_dir,
+                rec_model_dir=self.rec_model_dir,
+                cpu_threads=self.cpu_threads,
+                enable_mkldnn=self.enable_mkldnn,
+            )
+            self.use_backend(self.ocr_engine.text_detector, "det", self.det_model_dir)
+            self.use_backend(self.ocr_engine.text_recognizer, "rec", self.rec_model_dir)
+
+        return self.ocr_engine
+
+    def set_det_limit_side_len(self, limit_side_len):
+        """
+        Caps the longest side of the image seen by the text detectors of both engines.
+
+        :param limit_side_len: The maximum side length, in pixels.
+        :return: Self, to allow chaining.
+        """
+        detectors = [self.get_ocr_engine().text_detector, self.get_table_engine().text_system.text_detector]
+        for detector in detectors:
+            for op in detector.preprocess_op:
+                # DetResizeForTest is the operator resizing the input of the detector
+                if hasattr(op, "limit_side_len"):
+                    op.limit_side_len = limit_side_len
+
+        return self
+
     def detect_table(self):
-        table_engine = PPStructure(
-            show_log=True,
-            image_orientation=True,
-            lang="en",
-            table_model_dir=self.table_model_dir,
-            layout_model_dir=self.layout_model_dir,
-            layout_dict_path=self.layout_dict_path
-        )
+        table_engine = self.get_table_engine()
 
         img = cv2.imread(self.img_path)
         if img is None:
@@ -68,12 +139,7 @@ class OCRProcessor:
         return self
 
     def detect_text(self):
-        ocr = PaddleOCR(
-            use_angle_cls=True,
-            lang="en",
-            det_model_dir=self.det_model_dir,
-            rec_model_dir=self.rec_model_dir,
-        )
+        ocr = self.get_ocr_engine()
         self.result_text = ocr.ocr(self.img_path, cls=True)
         for idx in range(len(self.result_text)):
             res = self.result_text[idx]
@@ -0,0 +1,235 @@
+import glob
+import os
+import time
+
+import cv2
+import torch
+
+from image_enhancer import ImageEnhancer, load_upsampler
+from paddle_ocr4 import OCRProcessor
+
+SAVE_FOLDER = "./output/scheduled"
+FONT_PATH = "./fonts/german.ttf"
+MODEL_PATH = "RealESRGAN_x4plus.pth"
+
+# Degradation levels, from full quality to cheapest. A page runs at the first level that fits its budget.
+# det_limit_side_len caps the longest side of the image seen by the text detector (PaddleOCR's default is 960);
+# recognition and table structure still run on full resolution crops.
+LEVELS = (
+    {"enhance": True, "det_limit_side_len": 960, "visualize": True},
+    {"enhance": True, "det_limit_side_len": 960, "visualize": False},
+    {"enhance": False, "det_limit_side_len": 960, "visualize": False},
+    {"enhance": False, "det_limit_side_len": 480, "visualize": False},
+)
+
+
+def estimate_density(img, thumbnail_size=256):
+    """
+    Estimates how much content a page holds as the fraction of edge pixels in a thumbnail.
+
+    :param img: The grayscale image.
+    :param thumbnail_size: The size of the longest side of the thumbnail.
+    :return: The density, between 0 and 1.
+    """
+    height, width = img.shape[:2]
+    scale = min(1.0, thumbnail_size / max(height, width))
+    thumbnail = cv2.resize(img, (max(1, int(width * scale)), max(1, int(height * scale))), interpolation=cv2.INTER_AREA)
+    edges = cv2.Canny(thumbnail, 100, 200)
+    return cv2.countNonZero(edges) / edges.size
+
+
+class Page:
+    def __init__(self, image_path, deadline=None):
+        """
+        :param image_path: The path of the page image.
+        :param deadline: Optional. Seconds after the start of the run by which the page should be done.
+        """
+        self.image_path = image_path
+        self.deadline = deadline
+
+        img = cv2.imread(self.image_path, cv2.IMREAD_GRAYSCALE)
+        if img is None:
+            raise ValueError(f"Image at path {self.image_path} could not be loaded.")
+
+        self.height, self.width = img.shape[:2]
+        self.density = estimate_density(img)
+
+        self.level = None
+        self.estimate = None
+        self.seconds = None
+        self.finished_at = None
+
+    @property
+    def megapixels(self):
+        return self.width * self.height / 1e6
+
+
+class CostModel:
+    """
+    Predicts the seconds a page takes per stage from its size and content density.
+    The per-stage rates start from rough CPU priors and follow the measured timings.
+    """
+    def __init__(self, outscale=2, smoothing=0.3):
+        self.outscale = outscale
+        self.smoothing = smoothing
+        # Seconds per unit of work, see work()
+        self.rates = {"enhance": 8.0, "ocr": 1.5, "visualize": 0.2}
+
+    def work(self, page, level):
+        """
+        Returns the units of work of every stage of a page at a degradation level.
+        """
+        scale = self.outscale if level["enhance"] else 1
+        width, height = page.width * scale, page.height * scale
+        megapixels = width * height / 1e6
+
+        # Detection runs on the page resized to at most det_limit_side_len, recognition and
+        # table structure on full resolution crops, whose amount grows with the content density
+        det_scale = min(1.0, level["det_limit_side_len"] / max(width, height))
+        det_megapixels = megapixels * det_scale ** 2
+
+        return {
+            "enhance": page.megapixels if level["enhance"] else 0,
+            "ocr": det_megapixels + megapixels * page.density,
+            "visualize": megapixels if level["visualize"] else 0,
+        }
+
+    def estimate(self, page, level):
+        return sum(self.rates[stage] * work for stage, work in self.work(page, level).items())
+
+    def update(self, stage, work, seconds):
+        if work > 0:
+            self.rates[stage] += self.smoothing * (seconds / work - self.rates[stage])
+
+
+class PageScheduler:
+    """
+    Runs pages through the enhancer and OCR stages shortest-job-first or earliest-deadline-first,
+    degrading each page just enough to keep it within the per-page latency budget.
+    """
+    def __init__(self, budget=10.0, policy="sjf", outscale=2, model_path=MODEL_PATH):
+        """
+        :param budget: The per-page latency budget in seconds.
+        :param policy: 'sjf' for shortest-job-first or 'deadline' for earliest-deadline-first.
+        :param outscale: The enhancement scale factor.
+        :param model_path: The Real-ESRGAN weights.
+        """
+        if policy not in ("sjf", "deadline"):
+            raise ValueError("Policy must be either 'sjf' or 'deadline'.")
+
+        self.budget = budget
+        self.policy = policy
+        self.outscale = outscale
+        self.model_path = model_path
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+
+        self.pages = []
+        self.cost_model = CostModel(outscale=outscale)
+        self.upsampler = None
+        self.processor = OCRProcessor(save_folder=SAVE_FOLDER, img_path=None, font_path=FONT_PATH)
+
+    def add(self, image_path, deadline=None):
+        """
+        Queues a page.
+
+        :param image_path: The path of the page image.
+        :param deadline: Optional. Seconds after the start of the run by which the page should be done.
+        :return: Self, to allow chaining.
+        """
+        self.pages.append(Page(image_path, deadline))
+        return self
+
+    def ordered_pages(self):
+        full_quality = LEVELS[0]
+        if self.policy == "deadline":
+            return sorted(
+                self.pages,
+                key=lambda page: (page.deadline is None, page.deadline or 0, self.cost_model.estimate(page, full_quality)),
+            )
+        return sorted(self.pages, key=lambda page: self.cost_model.estimate(page, full_quality))
+
+    def choose_level(self, page, elapsed):
+        budget = self.budget
+        if page.deadline is not None:
+            budget = min(budget, page.deadline - elapsed)
+
+        for level in LEVELS:
+            if self.cost_model.estimate(page, level) <= budget:
+                return level
+        return LEVELS[-1]
+
+    def get_upsampler(self):
+        if self.upsampler is None:
+            self.upsampler = load_upsampler(self.model_path, self.device)
+        return self.upsampler
+
+    def timed(self, stage, work, function):
+        start = time.perf_counter()
+        result = function()
+        self.cost_model.update(stage, work, time.perf_counter() - start)
+        return result
+
+    def process(self, page, level):
+        work = self.cost_model.work(page, level)
+        image_path = page.image_path
+
+        if level["enhance"]:
+            image_path = self.timed("enhance", work["enhance"], lambda: (
+                ImageEnhancer(image_path, SAVE_FOLDER, model_path=self.model_path, model=self.get_upsampler())
+                .enhance(outscale=self.outscale)
+                .save()
+            ))
+
+        self.processor.set_det_limit_side_len(level["det_limit_side_len"])
+        self.processor.img_path = image_path
+        self.timed("ocr", work["ocr"], lambda: self.processor.detect_table().detect_text())
+
+        if level["visualize"]:
+            self.timed("visualize", work["visualize"], lambda: self.processor.draw_table_result().draw_text_result())
+
+    def run(self):
+        """
+        Processes every queued page and prints the budget adherence report.
+
+        :return: The processed pages, in the order they ran.
+        """
+        start = time.perf_counter()
+        pages = self.ordered_pages()
+
+        for page in pages:
+            level = self.choose_level(page, time.perf_counter() - start)
+            page.level = LEVELS.index(level)
+            page.estimate = self.cost_model.estimate(page, level)
+
+            page_start = time.perf_counter()
+            self.process(page, level)
+            page.seconds = time.perf_counter() - page_start
+            page.finished_at = time.perf_counter() - start
+
+        self.report(pages)
+        return pages
+
+    def report(self, pages):
+        print(f"{'image':<25}{'size':>12}{'density':>9}{'level':>7}{'estimate':>10}{'seconds':>9}{'met':>5}")
+
+        met = 0
+        for page in pages:
+            within_budget = page.seconds <= self.budget
+            if page.deadline is not None:
+                within_budget = within_budget and page.finished_at <= page.deadline
+            met += within_budget
+
+            print(
+                f"{os.path.basename(page.image_path):<25}{f'{page.width}x{page.height}':>12}{page.density:>9.3f}"
+                f"{page.level:>7}{page.estimate:>10.2f}{page.seconds:>9.2f}{'yes' if within_budget else 'no':>5}"
+            )
+
+        print(f"Budget adherence: {met}/{len(pages)} pages within {self.budget:.1f}s")
+
+
+if __name__ == "__main__":
+    scheduler = PageScheduler(budget=10.0, policy="sjf")
+    for image_path in sorted(glob.glob("sample/*.png")):
+        scheduler.add(image_path)
+
+    scheduler.run()
@@ -0,0 +1,107 @@
+import gc
+import glob
+import multiprocessing
+import os
+
+import psutil
+import torch
+
+from image_enhancer import ImageEnhancer, load_upsampler
+from paddle_ocr4 import OCRProcessor
+
+SAVE_FOLDER = "./output/workers"
+FONT_PATH = "./fonts/german.ttf"
+MODEL_PATH = "RealESRGAN_x4plus.pth"
+
+# Models of the current process. In shared mode they are loaded by the parent before
+# forking, so every worker maps the same physical pages copy-on-write.
+_upsampler = None
+_processor = None
+
+
+def load_models(device):
+    """
+    Loads the Real-ESRGAN upsampler and the Paddle engines into the module globals.
+    The Paddle engines run without MKL-DNN, so each model uses a single math thread.
+
+    :param device: The device of the upsampler.
+    """
+    global _upsampler, _processor
+
+    torch.set_grad_enabled(False)
+    _upsampler = load_upsampler(MODEL_PATH, device)
+    _processor = OCRProcessor(save_folder=SAVE_FOLDER, img_path=None, font_path=FONT_PATH)
+    _processor.get_table_engine()
+    _processor.get_ocr_engine()
+
+
+def init_worker(shared, threads_per_worker, device):
+    torch.set_num_threads(threads_per_worker)
+    if not shared:
+        load_models(device)
+
+
+def process_image(input_image_path):
+    """
+    Enhances an image and detects its tables with the models of the current worker.
+
+    :return: A tuple (input path, worker pid, worker unique RSS in bytes).
+    """
+    image_enhancer = ImageEnhancer(input_image_path, SAVE_FOLDER, model_path=MODEL_PATH, model=_upsampler)
+    enhanced_image_path = image_enhancer.enhance(outscale=2).save()
+
+    _processor.img_path = enhanced_image_path
+    _processor.detect_table()
+
+    return input_image_path, os.getpid(), psutil.Process().memory_full_info().uss
+
+
+def run(image_paths, workers=4, shared=True, threads_per_worker=1, device="cpu"):
+    """
+    Processes the images in a pool of worker processes and reports the unique RSS of each worker.
+
+    :param image_paths: The images to process.
+    :param workers: The number of worker processes.
+    :param shared: If True, load the models once and fork the workers after loading so the weights
+                   are shared copy-on-write. This requires device='cpu', since a CUDA context cannot be
+                   used in a forked process. If False, every worker loads its own copy.
+    :param threads_per_worker: Number of torch threads per worker. Paddle runs on one thread per model.
+    :param device: The device of the upsampler, 'cpu' or 'cuda'.
+    :return: A dict mapping worker pid to its peak unique RSS in bytes.
+    """
+    if shared and device != "cpu":
+        raise ValueError("Shared models can only be used on the CPU. Pass shared=False to run the upsampler on CUDA.")
+
+    if not os.path.exists(SAVE_FOLDER):
+        os.makedirs(SAVE_FOLDER)
+
+    if shared:
+        load_models(device)
+        # Move everything allocated so far out of the collector's reach, so that collections in the
+        # workers do not write to (and therefore copy) the pages holding the loaded models
+        gc.freeze()
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context("spawn")
+
+    unique_rss = {}
+    with context.Pool(workers, initializer=init_worker, initargs=(shared, threads_per_worker, device)) as pool:
+        for input_image_path, pid, uss in pool.imap_unordered(process_image, image_paths):
+            unique_rss[pid] = max(uss, unique_rss.get(pid, 0))
+            print(f"Processed {input_image_path} in worker {pid}")
+
+    parent = psutil.Process().memory_full_info()
+    print(f"Mode: {'shared' if shared else 'per-worker'} models on {device}, {workers} workers")
+    print(f"Parent RSS: {parent.rss / 2**20:.1f} MiB, unique RSS: {parent.uss / 2**20:.1f} MiB")
+    for pid, uss in sorted(unique_rss.items()):
+        print(f"Worker {pid} unique RSS: {uss / 2**20:.1f} MiB")
+    print(f"Total unique RSS: {(parent.uss + sum(unique_rss.values())) / 2**20:.1f} MiB")
+
+    return unique_rss
+
+
+if __name__ == "__main__":
+    image_paths = sorted(glob.glob("sample/*.png"))
+
+    # Shared models keep the upsampler on the CPU; on a CUDA host, compare with shared=False, device="cuda"
+    run(image_paths, workers=4, shared=True, device="cpu")